@@ -12,3 +12,15 @@ ACL_HOST_ASSIGNMENT_MODELS = Q(
 ACL_INTERFACE_ASSIGNMENT_MODELS = Q(
     Q(app_label="dcim", model="interface") | Q(app_label="virtualization", model="vminterface"),
 )
+
+# Static query_params for the site and device selectors, shared by the model and filter forms.
+SITE_QUERY_PARAMS = {
+    "region_id": "$region",
+    "group_id": "$site_group",
+}
+
+DEVICE_QUERY_PARAMS = {
+    "region_id": "$region",
+    "group_id": "$site_group",
+    "site_id": "$site",
+}
@@ -5,6 +5,7 @@ when filtering the sites list by status or region, for instance.
 import django_filters
 from dcim.models import Device, Interface, Region, Site, SiteGroup, VirtualChassis
 from django.db.models import Q
+from ipam.models import Prefix
 from netbox.filtersets import NetBoxModelFilterSet
 from virtualization.models import VirtualMachine, VMInterface
 
@@ -175,13 +176,24 @@ class ACLStandardRuleFilterSet(NetBoxModelFilterSet):
     Define the filter set for the django model ACLStandardRule.
     """
 
+    access_list = django_filters.ModelMultipleChoiceFilter(
+        field_name="access_list",
+        queryset=AccessList.objects.all(),
+        label="Access List",
+    )
+    source_prefix = django_filters.ModelMultipleChoiceFilter(
+        field_name="source_prefix",
+        queryset=Prefix.objects.all(),
+        label="Source Prefix",
+    )
+
     class Meta:
         """
         Associates the django model ACLStandardRule & fields to the filter set.
         """
 
         model = ACLStandardRule
-        fields = ("id", "access_list", "index", "action")
+        fields = ("id", "access_list", "index", "action", "source_prefix")
 
     def search(self, queryset, name, value):
         """
@@ -200,13 +212,37 @@ class ACLExtendedRuleFilterSet(NetBoxModelFilterSet):
     Define the filter set for the django model ACLExtendedRule.
     """
 
+    access_list = django_filters.ModelMultipleChoiceFilter(
+        field_name="access_list",
+        queryset=AccessList.objects.all(),
+        label="Access List",
+    )
+    source_prefix = django_filters.ModelMultipleChoiceFilter(
+        field_name="source_prefix",
+        queryset=Prefix.objects.all(),
+        label="Source Prefix",
+    )
+    destination_prefix = django_filters.ModelMultipleChoiceFilter(
+        field_name="destination_prefix",
+        queryset=Prefix.objects.all(),
+        label="Destination Prefix",
+    )
+
     class Meta:
         """
         Associates the django model ACLExtendedRule & fields to the filter set.
         """
 
         model = ACLExtendedRule
-        fields = ("id", "access_list", "index", "action", "protocol")
+        fields = (
+            "id",
+            "access_list",
+            "index",
+            "action",
+            "source_prefix",
+            "destination_prefix",
+            "protocol",
+        )
 
     def search(self, queryset, name, value):
         """
@@ -23,6 +23,7 @@ from ..choices import (
     ACLRuleActionChoices,
     ACLTypeChoices,
 )
+from ..constants import DEVICE_QUERY_PARAMS, SITE_QUERY_PARAMS
 from ..models import (
     AccessList,
     ACLExtendedRule,
@@ -37,6 +38,17 @@ __all__ = (
     "ACLExtendedRuleFilterForm",
 )
 
+# Sets standard querysets, limited to the columns needed to render the selected options,
+# to be used by the various classes
+access_list_queryset = AccessList.objects.only("pk", "name")
+prefix_queryset = Prefix.objects.only("pk", "prefix")
+
+# Sets a standard blank-prefixed rule action choices tuple to be used by the various classes
+rule_action_choices = add_blank_choice(ACLRuleActionChoices)
+
+# Sets a standard fieldset for the search and tag filters to be used by the various classes
+fieldset_search_tag = (None, ("q", "tag"))
+
 
 class AccessListFilterForm(NetBoxModelFilterSetForm):
     """
@@ -56,15 +68,11 @@ class AccessListFilterForm(NetBoxModelFilterSetForm):
     site = DynamicModelChoiceField(
         queryset=Site.objects.all(),
         required=False,
-        query_params={"region_id": "$region", "group_id": "$site_group"},
+        query_params=SITE_QUERY_PARAMS,
     )
     device_id = DynamicModelChoiceField(
         queryset=Device.objects.all(),
-        query_params={
-            "region_id": "$region",
-            "group_id": "$site_group",
-            "site_id": "$site",
-        },
+        query_params=DEVICE_QUERY_PARAMS,
         required=False,
         label=_("Device",),
     )
@@ -90,7 +98,7 @@ class AccessListFilterForm(NetBoxModelFilterSetForm):
     tag = TagFilterField(model)
 
     fieldsets = (
-        (None, ("q", "tag")),
+        fieldset_search_tag,
         (
             "Host Details",
             (
@@ -124,15 +132,11 @@ class ACLInterfaceAssignmentFilterForm(NetBoxModelFilterSetForm):
     site = DynamicModelChoiceField(
         queryset=Site.objects.all(),
         required=False,
-        query_params={"region_id": "$region", "group_id": "$site_group"},
+        query_params=SITE_QUERY_PARAMS,
     )
     device = DynamicModelChoiceField(
         queryset=Device.objects.all(),
-        query_params={
-            "region_id": "$region",
-            "group_id": "$site_group",
-            "site_id": "$site",
-        },
+        query_params=DEVICE_QUERY_PARAMS,
         required=False,
     )
     interface = DynamicModelChoiceField(
@@ -156,7 +160,7 @@ class ACLInterfaceAssignmentFilterForm(NetBoxModelFilterSetForm):
         label="Interface",
     )
     access_list = DynamicModelChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
         query_params={
             "assigned_object": "$device",
         },
@@ -183,20 +187,24 @@ class ACLStandardRuleFilterForm(NetBoxModelFilterSetForm):
     model = ACLStandardRule
     tag = TagFilterField(model)
     access_list = DynamicModelMultipleChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
+        query_params={
+            "type": ACLTypeChoices.TYPE_STANDARD,
+        },
         required=False,
+        label="Access List",
     )
     source_prefix = DynamicModelMultipleChoiceField(
-        queryset=Prefix.objects.all(),
+        queryset=prefix_queryset,
         required=False,
         label="Source Prefix",
     )
     action = forms.ChoiceField(
-        choices=add_blank_choice(ACLRuleActionChoices),
+        choices=rule_action_choices,
         required=False,
     )
     fieldsets = (
-        (None, ("q", "tag")),
+        fieldset_search_tag,
         ("Rule Details", ("access_list", "action", "source_prefix")),
     )
 
@@ -212,20 +220,24 @@ class ACLExtendedRuleFilterForm(NetBoxModelFilterSetForm):
     )
     tag = TagFilterField(model)
     access_list = DynamicModelMultipleChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
+        query_params={
+            "type": ACLTypeChoices.TYPE_EXTENDED,
+        },
         required=False,
+        label="Access List",
     )
     action = forms.ChoiceField(
-        choices=add_blank_choice(ACLRuleActionChoices),
+        choices=rule_action_choices,
         required=False,
     )
     source_prefix = DynamicModelMultipleChoiceField(
-        queryset=Prefix.objects.all(),
+        queryset=prefix_queryset,
         required=False,
         label="Source Prefix",
     )
-    desintation_prefix = DynamicModelMultipleChoiceField(
-        queryset=Prefix.objects.all(),
+    destination_prefix = DynamicModelMultipleChoiceField(
+        queryset=prefix_queryset,
         required=False,
         label="Destination Prefix",
     )
@@ -235,14 +247,14 @@ class ACLExtendedRuleFilterForm(NetBoxModelFilterSetForm):
     )
 
     fieldsets = (
-        (None, ("q", "tag")),
+        fieldset_search_tag,
         (
             "Rule Details",
             (
                 "access_list",
                 "action",
                 "source_prefix",
-                "desintation_prefix",
+                "destination_prefix",
                 "protocol",
             ),
         ),
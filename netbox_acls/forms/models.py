@@ -5,6 +5,7 @@ Defines each django model's GUI form to add or edit objects for each django mode
 from dcim.models import Device, Interface, Region, Site, SiteGroup, VirtualChassis
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Lower
 from django.utils.safestring import mark_safe
 from ipam.models import Prefix
 from netbox.forms import NetBoxModelForm
@@ -18,6 +19,7 @@ from virtualization.models import (
 )
 
 from ..choices import ACLTypeChoices
+from ..constants import DEVICE_QUERY_PARAMS, SITE_QUERY_PARAMS
 from ..models import (
     AccessList,
     ACLExtendedRule,
@@ -40,6 +42,22 @@ help_text_acl_rule_logic = mark_safe(
 help_text_acl_action = "Action the rule will take (remark, deny, or allow)."
 # Sets a standard help_text value to be used by the various classes for acl index
 help_text_acl_rule_index = "Determines the order of the rule in the ACL processing. AKA Sequence Number."
+# Sets the mark_safe help_text values used by the Meta help_texts of the various classes
+help_text_acl_type = mark_safe(
+    "<b>*Note:</b> CANNOT be changed if ACL Rules are assoicated to this Access List.",
+)
+help_text_acl_interface_assignment_direction = mark_safe(
+    "<b>*Note:</b> CANNOT assign 2 ACLs to the same interface & direction.",
+)
+help_text_acl_standard_rule_remark = mark_safe(
+    "<b>*Note:</b> CANNOT be set if source prefix OR action is set.",
+)
+help_text_acl_extended_rule_remark = mark_safe(
+    "<b>*Note:</b> CANNOT be set if action is not set to remark.",
+)
+
+# Sets a standard fieldset for the ACL rule's Access List details to be used by the various classes
+fieldset_acl_rule_access_list_details = ("Access List Details", ("access_list", "description", "tags"))
 
 # Sets a standard error message for ACL rules with an action of remark, but no remark set.
 error_message_no_remark = "Action is set to remark, you MUST add a remark."
@@ -47,6 +65,26 @@ error_message_no_remark = "Action is set to remark, you MUST add a remark."
 error_message_action_remark_source_prefix_set = "Action is set to remark, Source Prefix CANNOT be set."
 # Sets a standard error message for ACL rules with an action not set to remark, but no remark is set.
 error_message_remark_without_action_remark = "CANNOT set remark unless action is set to remark."
+# Sets a standard error message for ACL rules with an action of remark, but source_ports is set.
+error_message_action_remark_source_ports_set = "Action is set to remark, Source Ports CANNOT be set."
+# Sets a standard error message for ACL rules with an action of remark, but destination_prefix is set.
+error_message_action_remark_destination_prefix_set = "Action is set to remark, Destination Prefix CANNOT be set."
+# Sets a standard error message for ACL rules with an action of remark, but destination_ports is set.
+error_message_action_remark_destination_ports_set = "Action is set to remark, Destination Ports CANNOT be set."
+# Sets a standard error message for ACL rules with an action of remark, but protocol is set.
+error_message_action_remark_protocol_set = "Action is set to remark, Protocol CANNOT be set."
+# Sets the extended ACL rule fields that CANNOT be set with an action of remark, and their error messages.
+extended_rule_remark_conflicts = (
+    ("source_prefix", error_message_action_remark_source_prefix_set),
+    ("source_ports", error_message_action_remark_source_ports_set),
+    ("destination_prefix", error_message_action_remark_destination_prefix_set),
+    ("destination_ports", error_message_action_remark_destination_ports_set),
+    ("protocol", error_message_action_remark_protocol_set),
+)
+
+# Sets a standard queryset, limited to the columns needed to render the selected option,
+# to be used by the various classes
+access_list_queryset = AccessList.objects.only("pk", "name", "type")
 
 
 class AccessListForm(NetBoxModelForm):
@@ -72,16 +110,12 @@ class AccessListForm(NetBoxModelForm):
     site = DynamicModelChoiceField(
         queryset=Site.objects.all(),
         required=False,
-        query_params={"region_id": "$region", "group_id": "$site_group"},
+        query_params=SITE_QUERY_PARAMS,
     )
     device = DynamicModelChoiceField(
         queryset=Device.objects.all(),
         required=False,
-        query_params={
-            "region_id": "$region",
-            "group_id": "$site_group",
-            "site_id": "$site",
-        },
+        query_params=DEVICE_QUERY_PARAMS,
     )
 
     # Virtual Chassis selector
@@ -137,9 +171,7 @@ class AccessListForm(NetBoxModelForm):
         help_texts = {
             "default_action": "The default behavior of the ACL.",
             "name": "The name uniqueness per device is case insensitive.",
-            "type": mark_safe(
-                "<b>*Note:</b> CANNOT be changed if ACL Rules are assoicated to this Access List.",
-            ),
+            "type": help_text_acl_type,
         }
 
     def __init__(self, *args, **kwargs):
@@ -147,26 +179,27 @@ class AccessListForm(NetBoxModelForm):
         instance = kwargs.get("instance")
         initial = kwargs.get("initial", {}).copy()
         if instance:
-            if isinstance(instance.assigned_object, Device):
-                initial["device"] = instance.assigned_object
-                if instance.assigned_object.site:
-                    initial["site"] = instance.assigned_object.site
-                    if instance.assigned_object.site.group:
-                        initial["site_group"] = instance.assigned_object.site.group
-
-                    if instance.assigned_object.site.region:
-                        initial["region"] = instance.assigned_object.site.region
-            elif isinstance(instance.assigned_object, VirtualMachine):
-                initial["virtual_machine"] = instance.assigned_object
-                if instance.assigned_object.cluster:
-                    initial["cluster"] = instance.assigned_object.cluster
-                    if instance.assigned_object.cluster.group:
-                        initial["cluster_group"] = instance.assigned_object.cluster.group
-
-                    if instance.assigned_object.cluster.type:
-                        initial["cluster_type"] = instance.assigned_object.cluster.type
-            elif isinstance(instance.assigned_object, VirtualChassis):
-                initial["virtual_chassis"] = instance.assigned_object
+            assigned_object = instance.assigned_object
+            if isinstance(assigned_object, Device):
+                initial["device"] = assigned_object
+                if site := assigned_object.site:
+                    initial["site"] = site
+                    if site.group:
+                        initial["site_group"] = site.group
+
+                    if site.region:
+                        initial["region"] = site.region
+            elif isinstance(assigned_object, VirtualMachine):
+                initial["virtual_machine"] = assigned_object
+                if cluster := assigned_object.cluster:
+                    initial["cluster"] = cluster
+                    if cluster.group:
+                        initial["cluster_group"] = cluster.group
+
+                    if cluster.type:
+                        initial["cluster_type"] = cluster.type
+            elif isinstance(assigned_object, VirtualChassis):
+                initial["virtual_chassis"] = assigned_object
 
         kwargs["initial"] = initial
         super().__init__(*args, **kwargs)
@@ -200,21 +233,34 @@ class AccessListForm(NetBoxModelForm):
         if not device and not virtual_chassis and not virtual_machine:
             raise ValidationError({"__all__": "Access Lists must be assigned to a device, virtual chassis or virtual machine."})
 
-        existing_acls = None
         if device:
             host_type = "device"
-            existing_acls = AccessList.objects.filter(name=name, device=device).exists()
+            host = device
         elif virtual_machine:
             host_type = "virtual_machine"
-            existing_acls = AccessList.objects.filter(name=name, virtual_machine=virtual_machine).exists()
-        elif virtual_chassis:
+            host = virtual_machine
+        else:
             host_type = "virtual_chassis"
-            existing_acls = AccessList.objects.filter(name=name, virtual_chassis=virtual_chassis).exists()
-
-        # Check if duplicate entry.
-        if ("name" in self.changed_data or host_type in self.changed_data) and existing_acls:
-            error_same_acl_name = "An ACL with this name is already associated to this host."
-            raise ValidationError({host_type: [error_same_acl_name], "name": [error_same_acl_name]})
+            host = virtual_chassis
+
+        # Check if duplicate entry, only when the name or host changed.
+        # Case insensitive lookup on the GFK columns, served by the acl_unique_lower_name_per_host index.
+        # The constraint itself is not checked by model validation here, as the GFK columns are not form fields.
+        if "name" in self.changed_data or host_type in self.changed_data:
+            existing_acl = (
+                AccessList.objects.annotate(name_lower=Lower("name"))
+                .filter(
+                    name_lower=name.lower(),
+                    assigned_object_type=ContentType.objects.get_for_model(host),
+                    assigned_object_id=host.pk,
+                )
+                .exclude(pk=self.instance.pk)
+                .only("pk", "name")
+                .first()
+            )
+            if existing_acl:
+                error_same_acl_name = f'An ACL named "{existing_acl.name}" is already associated to {host}.'
+                raise ValidationError({host_type: [error_same_acl_name], "name": [error_same_acl_name]})
 
         # Check if Access List has no existing rules before change the Access List's type.
         if self.instance.pk and (
@@ -274,7 +320,7 @@ class ACLInterfaceAssignmentForm(NetBoxModelForm):
     #    label='Virtual Chassis',
     # )
     access_list = DynamicModelChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
         # query_params={
         #    'assigned_object': '$device',
         #    'assigned_object': '$virtual_machine',
@@ -291,11 +337,12 @@ class ACLInterfaceAssignmentForm(NetBoxModelForm):
         instance = kwargs.get("instance")
         initial = kwargs.get("initial", {}).copy()
         if instance:
-            if type(instance.assigned_object) is Interface:
-                initial["interface"] = instance.assigned_object
+            assigned_object = instance.assigned_object
+            if type(assigned_object) is Interface:
+                initial["interface"] = assigned_object
                 initial["device"] = "device"
-            elif type(instance.assigned_object) is VMInterface:
-                initial["vminterface"] = instance.assigned_object
+            elif type(assigned_object) is VMInterface:
+                initial["vminterface"] = assigned_object
                 initial["virtual_machine"] = "virtual_machine"
         kwargs["initial"] = initial
 
@@ -314,9 +361,7 @@ class ACLInterfaceAssignmentForm(NetBoxModelForm):
             "tags",
         )
         help_texts = {
-            "direction": mark_safe(
-                "<b>*Note:</b> CANNOT assign 2 ACLs to the same interface & direction.",
-            ),
+            "direction": help_text_acl_interface_assignment_direction,
         }
 
     def clean(self):
@@ -423,7 +468,7 @@ class ACLStandardRuleForm(NetBoxModelForm):
     """
 
     access_list = DynamicModelChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
         query_params={
             "type": ACLTypeChoices.TYPE_STANDARD,
         },
@@ -440,7 +485,7 @@ class ACLStandardRuleForm(NetBoxModelForm):
     )
 
     fieldsets = (
-        ("Access List Details", ("access_list", "description", "tags")),
+        fieldset_acl_rule_access_list_details,
         ("Rule Definition", ("index", "action", "remark", "source_prefix")),
     )
 
@@ -458,9 +503,7 @@ class ACLStandardRuleForm(NetBoxModelForm):
         help_texts = {
             "index": help_text_acl_rule_index,
             "action": help_text_acl_action,
-            "remark": mark_safe(
-                "<b>*Note:</b> CANNOT be set if source prefix OR action is set.",
-            ),
+            "remark": help_text_acl_standard_rule_remark,
         }
 
     def clean(self):
@@ -501,7 +544,7 @@ class ACLExtendedRuleForm(NetBoxModelForm):
     """
 
     access_list = DynamicModelChoiceField(
-        queryset=AccessList.objects.all(),
+        queryset=access_list_queryset,
         query_params={
             "type": ACLTypeChoices.TYPE_EXTENDED,
         },
@@ -524,7 +567,7 @@ class ACLExtendedRuleForm(NetBoxModelForm):
         label="Destination Prefix",
     )
     fieldsets = (
-        ("Access List Details", ("access_list", "description", "tags")),
+        fieldset_acl_rule_access_list_details,
         (
             "Rule Definition",
             (
@@ -555,15 +598,13 @@ class ACLExtendedRuleForm(NetBoxModelForm):
             "tags",
             "description",
         )
-        help_texts = {
+        help_texts = dict.fromkeys(
+            ("destination_ports", "protocol", "source_ports"),
+            help_text_acl_rule_logic,
+        ) | {
             "action": help_text_acl_action,
-            "destination_ports": help_text_acl_rule_logic,
             "index": help_text_acl_rule_index,
-            "protocol": help_text_acl_rule_logic,
-            "remark": mark_safe(
-                "<b>*Note:</b> CANNOT be set if action is not set to remark.",
-            ),
-            "source_ports": help_text_acl_rule_logic,
+            "remark": help_text_acl_extended_rule_remark,
         }
 
     def clean(self):
@@ -583,25 +624,13 @@ class ACLExtendedRuleForm(NetBoxModelForm):
 
         action = cleaned_data.get("action")
         remark = cleaned_data.get("remark")
-        source_prefix = cleaned_data.get("source_prefix")
-        source_ports = cleaned_data.get("source_ports")
-        destination_prefix = cleaned_data.get("destination_prefix")
-        destination_ports = cleaned_data.get("destination_ports")
-        protocol = cleaned_data.get("protocol")
 
         if action == "remark":
             if not remark:
                 error_message["remark"] = [error_message_no_remark]
-            if source_prefix:
-                error_message["source_prefix"] = [error_message_action_remark_source_prefix_set]
-            if source_ports:
-                error_message["source_ports"] = ["Action is set to remark, Source Ports CANNOT be set."]
-            if destination_prefix:
-                error_message["destination_prefix"] = ["Action is set to remark, Destination Prefix CANNOT be set."]
-            if destination_ports:
-                error_message["destination_ports"] = ["Action is set to remark, Destination Ports CANNOT be set."]
-            if protocol:
-                error_message["protocol"] = ["Action is set to remark, Protocol CANNOT be set."]
+            for field, field_error_message in extended_rule_remark_conflicts:
+                if cleaned_data.get(field):
+                    error_message[field] = [field_error_message]
         elif remark:
             error_message["remark"] = [error_message_remark_without_action_remark]
 
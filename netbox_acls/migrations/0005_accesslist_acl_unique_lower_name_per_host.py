@@ -0,0 +1,64 @@
+# Generated by Django 4.2.16 on 2026-10-14 10:03
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_insensitive_duplicates(apps, schema_editor):
+    """
+    Abort with a clear message if the host already has Access Lists whose names only differ in case,
+    as the acl_unique_lower_name_per_host constraint could not be created.
+    """
+    AccessList = apps.get_model("netbox_acls", "AccessList")
+    access_lists = AccessList.objects.using(schema_editor.connection.alias).annotate(name_lower=Lower("name"))
+
+    duplicates = (
+        access_lists.order_by()
+        .values("assigned_object_type", "assigned_object_id", "name_lower")
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+    )
+    if not duplicates:
+        return
+
+    conflicts = []
+    for duplicate in duplicates:
+        names = access_lists.filter(
+            assigned_object_type=duplicate["assigned_object_type"],
+            assigned_object_id=duplicate["assigned_object_id"],
+            name_lower=duplicate["name_lower"],
+        ).values_list("name", flat=True)
+        conflicts.append(
+            f"  - host (content type {duplicate['assigned_object_type']}, id {duplicate['assigned_object_id']}): "
+            f"{', '.join(sorted(names))}",
+        )
+    raise RuntimeError(
+        "Access List names must be unique per host regardless of case. "
+        "Rename the following Access Lists, then run migrate again:\n" + "\n".join(conflicts),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_acls", "0004_netbox_acls"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=check_case_insensitive_duplicates,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="accesslist",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                models.F("assigned_object_type"),
+                models.F("assigned_object_id"),
+                name="acl_unique_lower_name_per_host",
+                violation_error_message="An ACL with this name is already associated to this host.",
+            ),
+        ),
+    ]
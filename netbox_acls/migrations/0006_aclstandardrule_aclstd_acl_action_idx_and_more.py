@@ -0,0 +1,26 @@
+# Generated by Django 4.2.16 on 2026-10-14 11:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_acls", "0005_accesslist_acl_unique_lower_name_per_host"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="aclstandardrule",
+            index=models.Index(
+                fields=["access_list", "action"],
+                name="aclstd_acl_action_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="aclextendedrule",
+            index=models.Index(
+                fields=["access_list", "action", "protocol"],
+                name="aclext_acl_action_proto_idx",
+            ),
+        ),
+    ]
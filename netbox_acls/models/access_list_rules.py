@@ -107,16 +107,20 @@ class ACLStandardRule(ACLRule):
           - default_related_name for any FK relationships
           - verbose name (for displaying in the GUI)
           - verbose name plural (for displaying in the GUI)
+          - indexes for the filter form lookups
         """
 
         verbose_name = "ACL Standard Rule"
         verbose_name_plural = "ACL Standard Rules"
+        indexes = [
+            models.Index(fields=["access_list", "action"], name="aclstd_acl_action_idx"),
+        ]
 
 
 class ACLExtendedRule(ACLRule):
     """
     Inherits ACLRule.
-    Add ACLExtendedRule specific fields: source_ports, desintation_prefix, destination_ports, and protocol
+    Add ACLExtendedRule specific fields: source_ports, destination_prefix, destination_ports, and protocol
     """
 
     access_list = models.ForeignKey(
@@ -172,7 +176,11 @@ class ACLExtendedRule(ACLRule):
           - default_related_name for any FK relationships
           - verbose name (for displaying in the GUI)
           - verbose name plural (for displaying in the GUI)
+          - indexes for the filter form lookups
         """
 
         verbose_name = "ACL Extended Rule"
         verbose_name_plural = "ACL Extended Rules"
+        indexes = [
+            models.Index(fields=["access_list", "action", "protocol"], name="aclext_acl_action_proto_idx"),
+        ]
@@ -7,6 +7,7 @@ from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelatio
 from django.contrib.contenttypes.models import ContentType
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.functions import Lower
 from django.urls import reverse
 from netbox.models import NetBoxModel
 from virtualization.models import VirtualMachine, VMInterface
@@ -67,6 +68,15 @@ class AccessList(NetBoxModel):
     class Meta:
         unique_together = ["assigned_object_type", "assigned_object_id", "name"]
         ordering = ["assigned_object_type", "assigned_object_id", "name"]
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                "assigned_object_type",
+                "assigned_object_id",
+                name="acl_unique_lower_name_per_host",
+                violation_error_message="An ACL with this name is already associated to this host.",
+            ),
+        ]
         verbose_name = "Access List"
         verbose_name_plural = "Access Lists"
 
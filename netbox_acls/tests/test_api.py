@@ -1,5 +1,3 @@
-from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
-from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from rest_framework import status
 from utilities.testing import APITestCase, APIViewTestCases
@@ -7,6 +5,8 @@ from utilities.testing import APITestCase, APIViewTestCases
 from netbox_acls.choices import *
 from netbox_acls.models import *
 
+from .utils import create_access_lists, create_device
+
 
 class AppTest(APITestCase):
     def test_root(self):
@@ -27,50 +27,8 @@ class ACLTestCase(
 
     @classmethod
     def setUpTestData(cls):
-        site = Site.objects.create(name="Site 1", slug="site-1")
-        manufacturer = Manufacturer.objects.create(
-            name="Manufacturer 1",
-            slug="manufacturer-1",
-        )
-        devicetype = DeviceType.objects.create(
-            manufacturer=manufacturer,
-            model="Device Type 1",
-        )
-        devicerole = DeviceRole.objects.create(
-            name="Device Role 1",
-            slug="device-role-1",
-        )
-        device = Device.objects.create(
-            name="Device 1",
-            site=site,
-            device_type=devicetype,
-            role=devicerole,
-        )
-
-        access_lists = (
-            AccessList(
-                name="testacl1",
-                assigned_object_type=ContentType.objects.get_for_model(Device),
-                assigned_object_id=device.id,
-                type=ACLTypeChoices.TYPE_STANDARD,
-                default_action=ACLActionChoices.ACTION_DENY,
-            ),
-            AccessList(
-                name="testacl2",
-                assigned_object_type=ContentType.objects.get_for_model(Device),
-                assigned_object_id=device.id,
-                type=ACLTypeChoices.TYPE_STANDARD,
-                default_action=ACLActionChoices.ACTION_DENY,
-            ),
-            AccessList(
-                name="testacl3",
-                assigned_object_type=ContentType.objects.get_for_model(Device),
-                assigned_object_id=device.id,
-                type=ACLTypeChoices.TYPE_STANDARD,
-                default_action=ACLActionChoices.ACTION_DENY,
-            ),
-        )
-        AccessList.objects.bulk_create(access_lists)
+        device = create_device()
+        create_access_lists(device)
 
         cls.create_data = [
             {
@@ -95,3 +53,12 @@ class ACLTestCase(
                 "default_action": ACLActionChoices.ACTION_DENY,
             },
         ]
+
+    def test_create_duplicate_name_different_case(self):
+        """Test that an ACL name is unique per host regardless of case"""
+        self.add_permissions("netbox_acls.add_accesslist")
+        data = {**self.create_data[0], "name": "TestACL1"}
+
+        response = self.client.post(self._get_list_url(), data, format="json", **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,132 @@
+from django.test import TestCase
+
+from netbox_acls.choices import *
+from netbox_acls.filtersets import ACLExtendedRuleFilterSet, ACLStandardRuleFilterSet
+from netbox_acls.models import *
+
+from .utils import create_access_lists, create_device, create_prefixes
+
+
+class BaseACLRuleFilterSetTests:
+    """
+    Tests shared by the ACL rule filter sets.
+    Subclasses set queryset, filterset, and acl_type, then create the rules in setUpTestData:
+      - rules under testacl1 and testacl2, plus one rule under testacl3
+      - source prefixes 10.0.1.0/24 and 10.0.2.0/24 on two rules only
+    """
+
+    queryset = None
+    filterset = None
+    acl_type = None
+
+    @classmethod
+    def setUpTestData(cls):
+        device = create_device()
+        cls.access_lists = create_access_lists(device, acl_type=cls.acl_type)
+        cls.prefixes = create_prefixes()
+
+    def test_access_list(self):
+        params = {"access_list": [self.access_lists[0].pk, self.access_lists[1].pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+
+    def test_source_prefix(self):
+        params = {"source_prefix": [self.prefixes[0].pk, self.prefixes[1].pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+
+
+class ACLStandardRuleFilterSetTestCase(BaseACLRuleFilterSetTests, TestCase):
+    """Test the ACLStandardRule filter set"""
+
+    queryset = ACLStandardRule.objects.all()
+    filterset = ACLStandardRuleFilterSet
+    acl_type = ACLTypeChoices.TYPE_STANDARD
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        access_lists = cls.access_lists
+        prefixes = cls.prefixes
+
+        ACLStandardRule.objects.bulk_create(
+            (
+                ACLStandardRule(
+                    access_list=access_lists[0],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_PERMIT,
+                    source_prefix=prefixes[0],
+                ),
+                ACLStandardRule(
+                    access_list=access_lists[0],
+                    index=20,
+                    action=ACLRuleActionChoices.ACTION_PERMIT,
+                    source_prefix=prefixes[1],
+                ),
+                ACLStandardRule(
+                    access_list=access_lists[1],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_DENY,
+                    source_prefix=prefixes[2],
+                ),
+                ACLStandardRule(
+                    access_list=access_lists[2],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_DENY,
+                    source_prefix=prefixes[2],
+                ),
+            ),
+        )
+
+
+class ACLExtendedRuleFilterSetTestCase(BaseACLRuleFilterSetTests, TestCase):
+    """Test the ACLExtendedRule filter set"""
+
+    queryset = ACLExtendedRule.objects.all()
+    filterset = ACLExtendedRuleFilterSet
+    acl_type = ACLTypeChoices.TYPE_EXTENDED
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        access_lists = cls.access_lists
+        prefixes = cls.prefixes
+
+        ACLExtendedRule.objects.bulk_create(
+            (
+                ACLExtendedRule(
+                    access_list=access_lists[0],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_PERMIT,
+                    source_prefix=prefixes[0],
+                    destination_prefix=prefixes[2],
+                    protocol=ACLProtocolChoices.PROTOCOL_TCP,
+                ),
+                ACLExtendedRule(
+                    access_list=access_lists[0],
+                    index=20,
+                    action=ACLRuleActionChoices.ACTION_PERMIT,
+                    source_prefix=prefixes[1],
+                    destination_prefix=prefixes[0],
+                    protocol=ACLProtocolChoices.PROTOCOL_TCP,
+                ),
+                ACLExtendedRule(
+                    access_list=access_lists[1],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_DENY,
+                    source_prefix=prefixes[2],
+                    destination_prefix=prefixes[1],
+                    protocol=ACLProtocolChoices.PROTOCOL_UDP,
+                ),
+                ACLExtendedRule(
+                    access_list=access_lists[2],
+                    index=10,
+                    action=ACLRuleActionChoices.ACTION_DENY,
+                    source_prefix=prefixes[2],
+                    destination_prefix=prefixes[2],
+                    protocol=ACLProtocolChoices.PROTOCOL_UDP,
+                ),
+            ),
+        )
+
+    def test_destination_prefix(self):
+        params = {"destination_prefix": [self.prefixes[0].pk, self.prefixes[1].pk]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
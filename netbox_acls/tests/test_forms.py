@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from netbox_acls.choices import *
+from netbox_acls.forms import AccessListForm
+from netbox_acls.models import *
+
+from .utils import create_access_lists, create_device
+
+
+class AccessListFormTestCase(TestCase):
+    """Test the AccessList form validation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.device = create_device()
+        cls.access_lists = create_access_lists(cls.device)
+
+    def get_form_data(self, name, **kwargs):
+        return {
+            "name": name,
+            "device": self.device.pk,
+            "type": ACLTypeChoices.TYPE_STANDARD,
+            "default_action": ACLActionChoices.ACTION_DENY,
+            **kwargs,
+        }
+
+    def test_duplicate_name_different_case(self):
+        """Test that an ACL name already used on the host in another case is rejected"""
+        form = AccessListForm(data=self.get_form_data("TestACL1"))
+
+        self.assertFalse(form.is_valid())
+        error_same_acl_name = f'An ACL named "testacl1" is already associated to {self.device}.'
+        self.assertEqual(form.errors["name"], [error_same_acl_name])
+        self.assertEqual(form.errors["device"], [error_same_acl_name])
+
+    def test_rename_to_different_case_of_own_name(self):
+        """Test that an ACL can be renamed to another case of its own name"""
+        access_list = AccessList.objects.get(pk=self.access_lists[0].pk)
+        form = AccessListForm(data=self.get_form_data("TESTACL1"), instance=access_list)
+
+        self.assertTrue(form.is_valid(), form.errors)
+
+    def test_unchanged_name_and_host_skips_duplicate_query(self):
+        """Test that an edit changing neither the name nor the host runs no duplicate-name query"""
+        access_list = AccessList.objects.get(pk=self.access_lists[0].pk)
+        renamed_form = AccessListForm(data=self.get_form_data("testacl9"), instance=access_list)
+        with CaptureQueriesContext(connection) as renamed_queries:
+            self.assertTrue(renamed_form.is_valid(), renamed_form.errors)
+
+        access_list = AccessList.objects.get(pk=self.access_lists[0].pk)
+        unchanged_form = AccessListForm(
+            data=self.get_form_data("testacl1", comments="Updated comment"),
+            instance=access_list,
+        )
+        # Same validation as the rename, minus the duplicate-name probe.
+        with self.assertNumQueries(len(renamed_queries) - 1):
+            self.assertTrue(unchanged_form.is_valid(), unchanged_form.errors)
+        self.assertNotIn("name", unchanged_form.changed_data)
+        self.assertNotIn("device", unchanged_form.changed_data)
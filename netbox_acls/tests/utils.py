@@ -0,0 +1,61 @@
+"""
+Shared test data helpers for the netbox_acls tests.
+"""
+
+from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
+from django.contrib.contenttypes.models import ContentType
+from ipam.models import Prefix
+
+from netbox_acls.choices import ACLActionChoices, ACLTypeChoices
+from netbox_acls.models import AccessList
+
+
+def create_device():
+    """
+    Create a device, along with its site, manufacturer, device type, and device role.
+    """
+    site = Site.objects.create(name="Site 1", slug="site-1")
+    manufacturer = Manufacturer.objects.create(
+        name="Manufacturer 1",
+        slug="manufacturer-1",
+    )
+    devicetype = DeviceType.objects.create(
+        manufacturer=manufacturer,
+        model="Device Type 1",
+    )
+    devicerole = DeviceRole.objects.create(
+        name="Device Role 1",
+        slug="device-role-1",
+    )
+    return Device.objects.create(
+        name="Device 1",
+        site=site,
+        device_type=devicetype,
+        role=devicerole,
+    )
+
+
+def create_access_lists(device, acl_type=ACLTypeChoices.TYPE_STANDARD, count=3):
+    """
+    Create count Access Lists named testacl1, testacl2, ... assigned to the device.
+    """
+    access_lists = [
+        AccessList(
+            name=f"testacl{i}",
+            assigned_object_type=ContentType.objects.get_for_model(Device),
+            assigned_object_id=device.id,
+            type=acl_type,
+            default_action=ACLActionChoices.ACTION_DENY,
+        )
+        for i in range(1, count + 1)
+    ]
+    return AccessList.objects.bulk_create(access_lists)
+
+
+def create_prefixes():
+    """
+    Create the prefixes 10.0.1.0/24, 10.0.2.0/24, and 10.0.3.0/24.
+    """
+    return Prefix.objects.bulk_create(
+        [Prefix(prefix=f"10.0.{i}.0/24") for i in range(1, 4)],
+    )